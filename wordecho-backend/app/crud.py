@@ -2,7 +2,9 @@ from sqlalchemy.orm import Session
 from app import models, schemas
 from app.security import get_password_hash
 from sqlalchemy.orm import Session
-from app.models import User
+from app.models import User, Job
+from datetime import datetime
+import json
 from app.schemas import UserCreate, UserUpdate
 
 
@@ -35,6 +37,9 @@ def update_user(db: Session, user_id: int, user_update: UserUpdate):
     db.commit()
     return db_user
 
+def get_user_by_id(db: Session, user_id: int):
+    return db.query(User).filter(User.id == user_id).first()
+
 def delete_user(db: Session, user_id: int):
     db_user = db.query(User).filter(User.id == user_id).first()
     if db_user:
@@ -42,6 +47,31 @@ def delete_user(db: Session, user_id: int):
         db.commit()
         return True
     return False
+
+# background job operations
+def enqueue_job(db: Session, kind: str, payload: dict = None, max_attempts: int = 3):
+    db_job = Job(kind=kind, payload=json.dumps(payload or {}), max_attempts=max_attempts, run_after=datetime.utcnow())
+    db.add(db_job)
+    db.commit()
+    db.refresh(db_job)
+    return db_job
+
+def get_active_job(db: Session, kind: str, payload: dict = None):
+    # A pending or running job of the same kind and arguments, if any
+    return db.query(Job).filter(
+        Job.kind == kind,
+        Job.payload == json.dumps(payload or {}),
+        Job.status.in_(["pending", "running"]),
+    ).first()
+
+def get_job(db: Session, job_id: int):
+    return db.query(Job).filter(Job.id == job_id).first()
+
+def get_jobs(db: Session, status: str = None, skip: int = 0, limit: int = 10):
+    query = db.query(Job)
+    if status:
+        query = query.filter(Job.status == status)
+    return query.order_by(Job.id.desc()).offset(skip).limit(limit).all()
     
 def get_comments_for_blog(db: Session, blog_id: int):
     return db.query(models.Comment).filter(models.Comment.blog_id == blog_id).all()
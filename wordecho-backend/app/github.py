@@ -0,0 +1,59 @@
+# app/github.py
+import asyncio
+import os
+from typing import Optional
+
+import httpx
+
+# Base URL of the GitHub REST API (overridable so tests can point at a local mock server)
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+
+# Strict timeouts so a slow GitHub cannot tie up the worker during login
+GITHUB_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+GITHUB_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    # Shared, pooled client reused across logins so connections to GitHub stay warm
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            timeout=GITHUB_TIMEOUT,
+            limits=GITHUB_LIMITS,
+            headers={"Accept": "application/vnd.github+json"},
+        )
+    return _client
+
+
+async def close_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def fetch_github_identity(access_token: str):
+    # Fetch the profile and email list concurrently instead of one after the other
+    client = get_client()
+    headers = {"Authorization": f"Bearer {access_token}"}
+    user_response, emails_response = await asyncio.gather(
+        client.get("/user", headers=headers),
+        client.get("/user/emails", headers=headers),
+        return_exceptions=True,
+    )
+    # Only the profile lookup is required; a failed email lookup just leaves the email unresolved
+    if isinstance(user_response, Exception):
+        raise user_response
+    user_response.raise_for_status()
+    user_data = user_response.json()
+
+    email = user_data.get("email")
+    if email is None and isinstance(emails_response, httpx.Response) and emails_response.status_code == 200:
+        primary_emails = [e["email"] for e in emails_response.json() if e.get("primary") and e.get("verified")]
+        if primary_emails:
+            email = primary_emails[0]
+    return user_data, email
+
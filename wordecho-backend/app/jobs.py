@@ -0,0 +1,149 @@
+# app/jobs.py
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+from app import crud
+from app.database import SessionLocal, engine
+from app.models import Base, Job
+
+logger = logging.getLogger(__name__)
+
+# Base delay (in seconds) before a failed job is retried; doubles on every attempt
+RETRY_DELAY = 5
+POLL_INTERVAL = 1.0
+# How long (in seconds) a worker may hold a job before another worker can reclaim it
+JOB_LEASE = 300
+
+HANDLERS = {}
+
+
+class LeaseLost(Exception):
+    # Raised by a heartbeat when another worker has reclaimed the job
+    pass
+
+
+def job_handler(kind: str):
+    # Register a function as the handler for jobs of the given kind.
+    # Handlers are called as handler(db, heartbeat, **payload); long handlers should
+    # call heartbeat() after each committed chunk to renew their lease.
+    def register(func):
+        HANDLERS[kind] = func
+        return func
+    return register
+
+
+@job_handler("delete_user")
+def delete_user_job(db: Session, heartbeat, user_id: int):
+    # Only the user row is deleted for now. Once blogs and comments reference users,
+    # their cascades must be deleted here in chunks, calling heartbeat() after each one.
+    crud.delete_user(db, user_id)
+
+
+def claim_next_job(db: Session):
+    # Atomically move the oldest due job to running so concurrent workers never share one.
+    # While running, run_after holds the lease expiry; a job whose worker died is reclaimed after it.
+    now = datetime.utcnow()
+    expired = (Job.status == "running") & (Job.run_after <= now)
+    db.query(Job).filter(expired, Job.attempts >= Job.max_attempts).update(
+        {Job.status: "failed", Job.last_error: "Worker lease expired"}, synchronize_session=False
+    )
+    db.commit()
+
+    candidates = (
+        db.query(Job.id, Job.status, Job.run_after)
+        .filter(((Job.status == "pending") & (Job.run_after <= now)) | expired)
+        .order_by(Job.id)
+        .limit(10)
+        .all()
+    )
+    for job_id, job_status, run_after in candidates:
+        claimed = (
+            db.query(Job)
+            .filter(Job.id == job_id, Job.status == job_status, Job.run_after == run_after)
+            .update(
+                {
+                    Job.status: "running",
+                    Job.attempts: Job.attempts + 1,
+                    Job.run_after: now + timedelta(seconds=JOB_LEASE),
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        if claimed:
+            return crud.get_job(db, job_id)
+    return None
+
+
+def _holds_lease(job_id: int, lease: datetime):
+    return (Job.id == job_id, Job.status == "running", Job.run_after == lease)
+
+
+def run_next_job(db: Session):
+    job = claim_next_job(db)
+    if job is None:
+        return None
+    job_id, kind, payload, attempts = job.id, job.kind, job.payload, job.attempts
+    max_attempts, lease = job.max_attempts, job.run_after
+
+    def heartbeat():
+        # Extend the lease, or stop the handler if another worker has taken the job over
+        nonlocal lease
+        new_lease = datetime.utcnow() + timedelta(seconds=JOB_LEASE)
+        renewed = (
+            db.query(Job)
+            .filter(*_holds_lease(job_id, lease))
+            .update({Job.run_after: new_lease}, synchronize_session=False)
+        )
+        db.commit()
+        if not renewed:
+            raise LeaseLost(f"Job {job_id} was reclaimed by another worker")
+        lease = new_lease
+
+    try:
+        handler = HANDLERS[kind]
+        handler(db, heartbeat, **json.loads(payload))
+    except LeaseLost as e:
+        db.rollback()
+        logger.warning(str(e))
+        return None
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"Job {job_id} ({kind}) failed on attempt {attempts}")
+        if attempts >= max_attempts:
+            result = {Job.status: "failed", Job.last_error: str(e)}
+        else:
+            retry_at = datetime.utcnow() + timedelta(seconds=RETRY_DELAY * 2 ** (attempts - 1))
+            result = {Job.status: "pending", Job.last_error: str(e), Job.run_after: retry_at}
+    else:
+        result = {Job.status: "succeeded", Job.last_error: None}
+
+    # Only record the outcome if this worker still holds the lease
+    finished = db.query(Job).filter(*_holds_lease(job_id, lease)).update(result, synchronize_session=False)
+    db.commit()
+    if not finished:
+        logger.warning(f"Job {job_id} was reclaimed by another worker; discarding its result")
+        return None
+    return crud.get_job(db, job_id)
+
+
+def run_worker(poll_interval: float = POLL_INTERVAL):
+    # Worker process loop; start several processes to run jobs in parallel
+    logger.info("Job worker started")
+    while True:
+        db = SessionLocal()
+        try:
+            job = run_next_job(db)
+        finally:
+            db.close()
+        if job is None:
+            time.sleep(poll_interval)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    Base.metadata.create_all(bind=engine)
+    run_worker()
@@ -1,7 +1,7 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.routers import users, post,  contactus  # Import the updated users router with blogs and comments
+from app.routers import users, post,  contactus, jobs  # Import the updated users router with blogs and comments
 from app import models
 from app.database import engine
 import time 
@@ -25,6 +25,8 @@ from app import models, database, security
 from sqlalchemy.orm import Session
 from datetime import timedelta
 from dotenv import load_dotenv
+import httpx
+from app import github
 
 load_dotenv() 
 
@@ -70,6 +72,11 @@ models.Base.metadata.create_all(bind=engine)
 app.include_router(users.router, prefix="/api", tags=["users"])
 app.include_router(post.router, prefix="/api", tags=["posts"])
 app.include_router(contactus.router, prefix="/api", tags=["contactus"])
+app.include_router(jobs.router, prefix="/api", tags=["jobs"])
+
+@app.on_event("shutdown")
+async def close_github_client():
+    await github.close_client()
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
@@ -95,20 +102,16 @@ async def github_login(request: Request):
 @app.get("/auth/github/callback")
 async def github_callback(request: Request, db: Session = Depends(database.get_db)):
     token = await oauth.github.authorize_access_token(request)
-    
-    # Retrieve user data from GitHub
-    user_data = await oauth.github.get('https://api.github.com/user', token=token)
-    user_data = user_data.json()
 
-    # Check if email is available, if not, get it from /user/emails endpoint
-    email = user_data.get('email')
-    if email is None:
-        emails_data = await oauth.github.get('https://api.github.com/user/emails', token=token)
-        emails_data = emails_data.json()
-        primary_emails = [e['email'] for e in emails_data if e.get('primary') and e.get('verified')]
-        if primary_emails:
-            email = primary_emails[0]
-    
+    # Retrieve profile and emails from GitHub concurrently over the shared pooled client
+    try:
+        user_data, email = await github.fetch_github_identity(token["access_token"])
+    except httpx.HTTPError:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Could not retrieve user information from GitHub."
+        )
+
     # If email is still None, raise an exception
     if email is None:
         raise HTTPException(
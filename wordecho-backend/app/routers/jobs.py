@@ -0,0 +1,30 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app import crud, schemas
+from app.database import get_db
+from app.security import get_current_active_user
+
+router = APIRouter()
+
+
+@router.get("/jobs/", response_model=list[schemas.JobResponse])
+def read_jobs(
+    status: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 10,
+    db: Session = Depends(get_db),
+    current_user: schemas.UserResponse = Depends(get_current_active_user),
+):
+    return crud.get_jobs(db, status=status, skip=skip, limit=limit)
+
+@router.get("/jobs/{job_id}", response_model=schemas.JobResponse)
+def read_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: schemas.UserResponse = Depends(get_current_active_user),
+):
+    job = crud.get_job(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.schemas import UserCreate, UserResponse, UserUpdate
-from app.crud import get_users, create_user, update_user, delete_user
+from app.crud import get_users, create_user, update_user, get_user_by_id, get_active_job, enqueue_job
 from app.database import get_db
 from app.security import get_current_active_user
 
@@ -28,8 +28,12 @@ def edit_user(user_id: int, user_update: UserUpdate, db: Session = Depends(get_d
         raise HTTPException(status_code=404, detail="User not found")
     return updated_user
 
-@router.delete("/users/{user_id}")
+@router.delete("/users/{user_id}", status_code=202)
 def remove_user(user_id: int, db: Session = Depends(get_db)):
-    if not delete_user(db, user_id):
+    if not get_user_by_id(db, user_id):
         raise HTTPException(status_code=404, detail="User not found")
-    return {"success": True}
+    # Deletion runs on the background job queue; repeated requests reuse the queued job
+    job = get_active_job(db, "delete_user", {"user_id": user_id})
+    if job is None:
+        job = enqueue_job(db, "delete_user", {"user_id": user_id})
+    return {"success": True, "job_id": job.id}
@@ -68,3 +68,18 @@ class ContactCreate(BaseModel):
     email: str
     phone: Optional[str]
     message: str
+
+
+# Background Job Schema
+class JobResponse(BaseModel):
+    id: int
+    kind: str
+    status: str
+    attempts: int
+    max_attempts: int
+    last_error: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        orm_mode = True
@@ -67,8 +67,8 @@ def test_delete_user(client, test_db):
     test_db.add(user)
     test_db.commit()
     response = client.delete(f"/api/users/{user.id}")
-    assert response.status_code == 200
-    assert response.json() == {"success": True}
+    assert response.status_code == 202
+    assert response.json()["success"] is True
 
 
 def test_create_blog(client, setup_test_data):
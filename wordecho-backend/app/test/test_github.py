@@ -0,0 +1,151 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from fastapi.testclient import TestClient
+from app import github, security
+from app.main import app, oauth
+from app.database import Base, engine, SessionLocal
+from app.models import User
+
+# Simulated GitHub API latency per request (in seconds)
+GITHUB_DELAY = 0.3
+
+
+class MockGitHubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(GITHUB_DELAY)
+        if self.path == "/user":
+            if self.server.fail_user:
+                self.close_connection = True
+                return
+            body = {"id": 42, "login": "octocat", "name": "The Octocat", "email": self.server.public_email}
+        elif self.path == "/user/emails":
+            if self.server.fail_emails:
+                # Drop the connection without a response to simulate a network failure
+                self.close_connection = True
+                return
+            body = [
+                {"email": "secondary@example.com", "primary": False, "verified": True},
+                {"email": "octocat@example.com", "primary": True, "verified": True},
+            ]
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def fetch_and_close(access_token):
+    # Each test runs its own event loop, so release the pooled client before it closes
+    try:
+        return await github.fetch_github_identity(access_token)
+    finally:
+        await github.close_client()
+
+
+@pytest.fixture
+def mock_github(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockGitHubHandler)
+    server.public_email = None
+    server.fail_emails = False
+    server.fail_user = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(github, "GITHUB_API_URL", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setattr(github, "_client", None)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def callback_client(mock_github, monkeypatch):
+    async def fake_authorize_access_token(request):
+        return {"access_token": "test-token"}
+    monkeypatch.setattr(oauth.github, "authorize_access_token", fake_authorize_access_token)
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    # Record the user id each issued JWT is for
+    issued = []
+    create_access_token = security.create_access_token
+    def recording_create_access_token(data, expires_delta=None):
+        issued.append(int(data["sub"]))
+        return create_access_token(data, expires_delta)
+    monkeypatch.setattr(security, "create_access_token", recording_create_access_token)
+
+    # One client for the whole test so the pooled GitHub client stays on a single event loop
+    with TestClient(app) as client:
+        client.issued = issued
+        yield client
+
+
+def login(client):
+    return client.get("/auth/github/callback", follow_redirects=False)
+
+
+def test_fetch_github_identity_uses_primary_email(mock_github):
+    user_data, email = asyncio.run(fetch_and_close("test-token"))
+    assert user_data["id"] == 42
+    assert email == "octocat@example.com"
+
+
+def test_fetch_github_identity_runs_lookups_concurrently(mock_github):
+    start = time.perf_counter()
+    asyncio.run(fetch_and_close("test-token"))
+    elapsed = time.perf_counter() - start
+    # Sequential calls would take at least two round trips
+    assert elapsed < 2 * GITHUB_DELAY
+
+
+def test_callback_latency(callback_client):
+    start = time.perf_counter()
+    response = login(callback_client)
+    elapsed = time.perf_counter() - start
+    assert response.status_code == 307
+    assert elapsed < 2 * GITHUB_DELAY
+
+
+def test_callback_reuses_existing_user(callback_client):
+    login(callback_client)
+    response = login(callback_client)
+    assert response.status_code == 307
+    assert callback_client.issued[0] == callback_client.issued[1]
+    db = SessionLocal()
+    assert db.query(User).filter(User.email == "octocat@example.com").count() == 1
+    db.close()
+
+
+def test_callback_survives_emails_failure(callback_client, mock_github):
+    mock_github.public_email = "public@example.com"
+    mock_github.fail_emails = True
+    response = login(callback_client)
+    assert response.status_code == 307
+    db = SessionLocal()
+    assert db.query(User).filter(User.email == "public@example.com").first() is not None
+    db.close()
+
+
+def test_callback_without_email_is_rejected(callback_client, mock_github):
+    mock_github.fail_emails = True
+    response = login(callback_client)
+    assert response.status_code == 400
+
+
+def test_callback_profile_failure_is_bad_gateway(callback_client, mock_github):
+    mock_github.fail_user = True
+    response = login(callback_client)
+    assert response.status_code == 502
@@ -0,0 +1,167 @@
+import pytest
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from app.main import app
+from app.database import Base, engine, get_db
+from sqlalchemy.orm import sessionmaker
+from app.models import User, Job
+from app import jobs, security
+
+TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture
+def client():
+    def override_get_db():
+        db = TestSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+@pytest.fixture
+def test_db():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = TestSessionLocal()
+    yield db
+    db.close()
+
+@pytest.fixture
+def auth_headers(test_db):
+    admin = User(name="Admin", email="admin@example.com", password="password")
+    test_db.add(admin)
+    test_db.commit()
+    token = security.create_access_token(data={"sub": str(admin.id)})
+    return {"Authorization": f"Bearer {token}"}
+
+def test_delete_user_runs_as_job(client, test_db, auth_headers):
+    user = User(name="Eve", email="eve@example.com", password="password")
+    test_db.add(user)
+    test_db.commit()
+    response = client.delete(f"/api/users/{user.id}")
+    assert response.status_code == 202
+    data = response.json()
+    assert data["success"] is True
+
+    response = client.get(f"/api/jobs/{data['job_id']}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+
+    job = jobs.run_next_job(test_db)
+    assert job.id == data["job_id"]
+    assert job.status == "succeeded"
+    assert test_db.query(User).filter(User.email == "eve@example.com").first() is None
+
+    response = client.get(f"/api/jobs/{data['job_id']}", headers=auth_headers)
+    assert response.json()["status"] == "succeeded"
+
+def test_delete_missing_user(client, test_db):
+    response = client.delete("/api/users/9999")
+    assert response.status_code == 404
+
+def test_repeated_delete_reuses_job(client, test_db):
+    user = User(name="Eve", email="eve@example.com", password="password")
+    test_db.add(user)
+    test_db.commit()
+    first = client.delete(f"/api/users/{user.id}").json()
+    second = client.delete(f"/api/users/{user.id}").json()
+    assert first["job_id"] == second["job_id"]
+    assert test_db.query(Job).count() == 1
+
+def test_read_missing_job(client, test_db, auth_headers):
+    response = client.get("/api/jobs/9999", headers=auth_headers)
+    assert response.status_code == 404
+
+def test_jobs_require_authentication(client, test_db):
+    assert client.get("/api/jobs/").status_code == 401
+    assert client.get("/api/jobs/1").status_code == 401
+
+def test_failed_job_is_retried(test_db, monkeypatch):
+    def failing_handler(db, heartbeat):
+        raise RuntimeError("boom")
+    monkeypatch.setitem(jobs.HANDLERS, "failing", failing_handler)
+    monkeypatch.setattr(jobs, "RETRY_DELAY", 0)
+    test_db.add(Job(kind="failing", payload="{}", max_attempts=2))
+    test_db.commit()
+
+    job = jobs.run_next_job(test_db)
+    assert job.status == "pending"
+    assert job.attempts == 1
+    assert job.last_error == "boom"
+
+    job = jobs.run_next_job(test_db)
+    assert job.status == "failed"
+    assert job.attempts == 2
+    assert jobs.run_next_job(test_db) is None
+
+def test_job_from_dead_worker_is_reclaimed(test_db):
+    test_db.add(Job(kind="delete_user", payload='{"user_id": 9999}', max_attempts=2))
+    test_db.commit()
+
+    # A worker claims the job and dies before finishing it
+    job = jobs.claim_next_job(test_db)
+    assert job.status == "running"
+    assert jobs.claim_next_job(test_db) is None
+
+    # Once the lease has expired another worker picks it up
+    job.run_after = datetime.utcnow() - timedelta(seconds=1)
+    test_db.commit()
+    job = jobs.run_next_job(test_db)
+    assert job.status == "succeeded"
+    assert job.attempts == 2
+
+def test_expired_job_without_attempts_left_fails(test_db):
+    test_db.add(Job(kind="delete_user", payload='{"user_id": 9999}', max_attempts=1))
+    test_db.commit()
+    job = jobs.claim_next_job(test_db)
+    job.run_after = datetime.utcnow() - timedelta(seconds=1)
+    test_db.commit()
+
+    assert jobs.claim_next_job(test_db) is None
+    test_db.refresh(job)
+    assert job.status == "failed"
+    assert job.last_error == "Worker lease expired"
+
+def reclaim(job_id):
+    # Expire the lease and let a second worker claim the job
+    other_db = TestSessionLocal()
+    other_db.query(Job).filter(Job.id == job_id).update({Job.run_after: datetime.utcnow() - timedelta(seconds=1)})
+    other_db.commit()
+    assert jobs.claim_next_job(other_db).id == job_id
+    other_db.close()
+
+def test_stale_worker_result_is_discarded(test_db, monkeypatch):
+    def slow_handler(db, heartbeat):
+        reclaim(job_id)
+    monkeypatch.setitem(jobs.HANDLERS, "slow", slow_handler)
+    job = Job(kind="slow", payload="{}", max_attempts=3)
+    test_db.add(job)
+    test_db.commit()
+    job_id = job.id
+
+    assert jobs.run_next_job(test_db) is None
+    job = test_db.query(Job).filter(Job.id == job_id).first()
+    test_db.refresh(job)
+    assert job.status == "running"
+    assert job.attempts == 2
+
+def test_heartbeat_renews_lease_and_detects_reclaim(test_db, monkeypatch):
+    leases = []
+    def chunked_handler(db, heartbeat):
+        heartbeat()
+        leases.append(db.query(Job.run_after).filter(Job.id == job_id).scalar())
+        reclaim(job_id)
+        heartbeat()
+        leases.append("not reached")
+    monkeypatch.setitem(jobs.HANDLERS, "chunked", chunked_handler)
+    job = Job(kind="chunked", payload="{}", max_attempts=3)
+    test_db.add(job)
+    test_db.commit()
+    job_id = job.id
+
+    assert jobs.run_next_job(test_db) is None
+    assert len(leases) == 1
+    assert leases[0] > datetime.utcnow()